@@ -1,7 +1,7 @@
-import json
-import yaml
+import copy
 import inspect
-import tomllib
+import functools
+import threading
 from enum import Enum
 from pathlib import Path
 from dataclasses import is_dataclass, fields, make_dataclass, field
@@ -9,34 +9,123 @@ from typing import Any, Union, NewType, Iterable, Dict, List
 
 from .utils import iterate_and_fetch_dict_value
 
+# Prefer orjson (Rust-backed, several times faster) when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
 CallableObj = NewType("CallableObj", Any)
 
+# Per-thread scratch storage reused across morph calls to avoid allocating
+# a fresh unused-keys set on every invocation
+_SCRATCH = threading.local()
+
+# Parsed config files keyed on (resolved path, mtime_ns, size) so repeated
+# loads of an unchanged file collapse to a stat plus a dict lookup
+_FILE_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+
+def _load_cached(config_path: Path, parse):
+    stat = config_path.stat()
+    cache_key = (str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    config_data = _FILE_CACHE.get(cache_key)
+    if config_data is None:
+        config_data = _FILE_CACHE[cache_key] = parse(config_path)
+    # Shallow copy so callers mutating the top level don't poison the cache
+    return copy.copy(config_data)
+
+
+def _parse_toml(config_path: Path):
+    import tomllib  # deferred so JSON/YAML-only callers never pay for it
+
+    with config_path.open("rb") as f:
+        return tomllib.load(f)
+
+
+def _parse_json(config_path: Path):
+    with config_path.open("rb") as f:
+        return _json_loads(f.read())
+
+
+def _parse_yaml(config_path: Path):
+    import yaml  # deferred: yaml is the slowest import and often unused
+
+    # Prefer the libyaml-backed loader (~10x faster) when PyYAML has it
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
+
+    with config_path.open("r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)
 
+
+@functools.cache
 def create_dataclass_from_callable(callable_obj):
     """
     Create a dataclass based on the signature of a callable (function or method).
+    Results are cached per callable, so repeated morphs of the same schema skip
+    the signature introspection and class synthesis entirely.
     """
     if not callable(callable_obj):
         raise TypeError(f'{callable_obj} is not callable.')
 
-    signature = inspect.signature(callable_obj)
-    fields_list = []
+    code = getattr(callable_obj, '__code__', None)
+    if code is not None:
+        # Read the signature straight off the code object; far cheaper than
+        # inspect.signature for plain functions and __init__ methods
+        annotations = getattr(callable_obj, '__annotations__', {})
+        nargs = code.co_argcount
+        defaults = callable_obj.__defaults__ or ()
+        first_default = nargs - len(defaults)
+        params = [
+            (name, annotations.get(name, Any), defaults[i - first_default] if i >= first_default else None)
+            for i, name in enumerate(code.co_varnames[:nargs])
+        ]
+        # Keyword-only parameters live past co_argcount
+        kwdefaults = callable_obj.__kwdefaults__ or {}
+        params += [
+            (name, annotations.get(name, Any), kwdefaults.get(name))
+            for name in code.co_varnames[nargs:nargs + code.co_kwonlyargcount]
+        ]
+    else:
+        # C-implemented callables expose no __code__; fall back to inspect
+        params = [
+            (
+                param_name,
+                param.annotation if param.annotation is not param.empty else Any,
+                param.default if param.default is not param.empty else None,
+            )
+            for param_name, param in inspect.signature(callable_obj).parameters.items()
+        ]
 
-    for param_name, param in signature.parameters.items():
+    fields_list = []
+    for param_name, param_type, param_default in params:
         if param_name in ('self', 'cls'):
             continue
-        param_type = param.annotation if param.annotation is not param.empty else Any
-        param_default = param.default if param.default is not param.empty else None
 
         # Handle mutable default values
         if param_default is not None and isinstance(param_default, (list, dict, set)):
             # Use default_factory for mutable defaults
-            fields_list.append((param_name, param_type, field(default_factory=lambda: param_default.__class__())))
+            fields_list.append((param_name, param_type, field(default_factory=param_default.__class__)))
         else:
             fields_list.append((param_name, param_type, param_default))
 
     dataclass_name = f"{callable_obj.__name__}DataClass"
-    return make_dataclass(dataclass_name, fields_list)
+    return make_dataclass(dataclass_name, fields_list, slots=True)
+
+
+@functools.cache
+def _schema_spec(callable_obj):
+    """
+    Cached (dataclass, field-name set) pair for a callable schema, so `morph`
+    avoids rebuilding the annotation set on every call.
+    """
+    data_class = create_dataclass_from_callable(callable_obj)
+    return data_class, frozenset(data_class.__annotations__)
 
 
 class ReturnType(Enum):
@@ -49,6 +138,9 @@ class ConfigMorpher:
     A class to handle the parsing of dictionaries into dataclass instances.
     This class morphs a given configuration dictionary into specified `callable_obj` formats dynamically.
     """
+
+    __slots__ = ('config',)
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the ConfigMorpher with a configuration dictionary.
@@ -69,9 +161,7 @@ class ConfigMorpher:
             ConfigMorpher: An initialized ConfigMorpher instance.
         """
         config_path = Path(config_path)  # Ensure `config_path` is a Path object
-        with config_path.open("rb") as f:  # Use Path's open method
-            config_data = tomllib.load(f)
-        return cls(config_data)
+        return cls(_load_cached(config_path, _parse_toml))
 
     @classmethod
     def from_json(cls, config_path: Path):
@@ -83,9 +173,7 @@ class ConfigMorpher:
             ConfigMorpher: An initialized ConfigMorpher instance.
         """
         config_path = Path(config_path)  # Ensure `config_path` is a Path object
-        with config_path.open("rb") as f:  # Use Path's open method
-            config_data = json.load(f)
-        return cls(config_data)
+        return cls(_load_cached(config_path, _parse_json))
 
     @classmethod
     def from_yaml(cls, config_path: Path):
@@ -97,9 +185,7 @@ class ConfigMorpher:
             ConfigMorpher: An initialized ConfigMorpher instance.
         """
         config_path = Path(config_path)  # Ensure `config_path` is a Path object
-        with config_path.open("r", encoding="utf-8") as f:  # Use Path's open method
-            config_data = yaml.safe_load(f)
-        return cls(config_data)
+        return cls(_load_cached(config_path, _parse_yaml))
 
     def morph(
         self,
@@ -132,47 +218,67 @@ class ConfigMorpher:
         if start_from:
             config = iterate_and_fetch_dict_value(config, start_from)
 
-        # Ensure `callable_obj` is iterable
-        if not isinstance(callable_obj, Iterable):
-            callable_obj = [callable_obj]
+        # Ensure `callable_obj` is a sequence of schemas; a plain
+        # (list, tuple) check is both faster than the Iterable protocol
+        # dispatch and avoids misclassifying iterable schema objects
+        if not isinstance(callable_obj, (list, tuple)):
+            callable_obj = (callable_obj,)
+
+        # Normalize the return type to an enum member once, so later checks
+        # are plain identity comparisons
+        if not isinstance(return_type, ReturnType):
+            try:
+                return_type = ReturnType(return_type)
+            except ValueError:
+                raise ValueError(f"Invalid return_type: {return_type}. Choose from: {[rtype.value for rtype in ReturnType]}.") from None
+        want_dataclass = return_type is ReturnType.DATACLASS
 
-        outputs, unused_keys = [], set(config.keys())
+        # Reuse a per-thread scratch set instead of allocating one per call;
+        # it never escapes this function, so clear-and-refill is safe
+        unused_keys = getattr(_SCRATCH, 'unused_keys', None)
+        if unused_keys is None:
+            unused_keys = _SCRATCH.unused_keys = set()
+        # One keys view shared by every schema's intersection below
+        config_keys = config.keys()
+
+        unused_keys.clear()
+        unused_keys.update(config_keys)
+
+        outputs = []
 
         for schema in callable_obj:
             if is_dataclass(schema):
                 # Handle dataclass schemas
+                constructor = schema
                 keys = {f.name for f in fields(schema) if f.init}
-                inputs = {k: v for k, v in config.items() if k in keys}
-                unused_keys.difference_update(inputs.keys())
-                output = schema(**inputs)
 
             elif inspect.isclass(schema) and '__init__' in schema.__dict__:
                 # Handle classes with constructors
-                data_class = create_dataclass_from_callable(schema.__init__)
-                inputs = {k: v for k, v in config.items() if k in data_class.__annotations__}
-                unused_keys.difference_update(inputs.keys())
-                output = data_class(**inputs)
+                constructor, keys = _schema_spec(schema.__init__)
 
             elif inspect.ismethod(schema) or inspect.isfunction(schema):
                 # Handle pure functions
-                data_class = create_dataclass_from_callable(schema)
-                inputs = {k: v for k, v in config.items() if k in data_class.__annotations__}
-                unused_keys.difference_update(inputs.keys())
-                output = data_class(**inputs)
+                constructor, keys = _schema_spec(schema)
 
             else:
                 raise TypeError(f'{schema} is not a valid type.')
 
+            # Intersect in C instead of scanning every config item per schema
+            keys_present = keys & config_keys
+            inputs = {k: config[k] for k in keys_present}
+            unused_keys -= keys_present
+
             # Handle the return type logic
-            if return_type in [ReturnType.DATACLASS, ReturnType.DATACLASS.value]:
-                outputs.append(output)
-            elif return_type in [ReturnType.DICT, ReturnType.DICT.value]:
-                output_dict = output.__dict__
-                if return_config_keys_only:
-                    output_dict = {k: output_dict[k] for k in output_dict if k in config}
-                outputs.append(output_dict)
+            if want_dataclass:
+                outputs.append(constructor(**inputs))
+            elif return_config_keys_only:
+                # `inputs` already holds exactly the config keys this schema
+                # consumes, so the dataclass round-trip would be dead work
+                outputs.append(inputs)
             else:
-                raise ValueError(f"Invalid return_type: {return_type}. Choose from: {[rtype.value for rtype in ReturnType]}.")
+                # Defaults are needed, so materialize the dataclass after all
+                output = constructor(**inputs)
+                outputs.append({f.name: getattr(output, f.name) for f in fields(output)})
 
         # Validate unused keys if disallowed
         if not allow_extra_keys and unused_keys:
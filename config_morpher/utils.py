@@ -1,21 +1,74 @@
 import re
+import functools
 
-from typing import Any, List, Union
+from typing import Any, List, Tuple, Union
+
+
+# Matches either a bare key segment or a bracketed selector in one pass
+_TOKEN_RE = re.compile(r'([^.\[\]]+)|\[([^\]]*)\]')
+
+# Sentinel distinguishing "key missing" from a legitimately stored None
+_MISSING = object()
 
 
 def split_by_dot_and_brackets(s:str):
-    parts = re.split(r'\.(?![^\[]*\])', s)
-    result = []
-    for part in parts:
-        match = re.match(r'([^\[]+)(\[.*\])?', part)
-        if match:
-            result.append(match.group(1))
-            if match.group(2):
-                result.append(match.group(2))
-    return result
-
-def check_key_under_brackets(key:str):
-    return bool(key.startswith('[') and key.endswith(']'))
+    return [
+        m.group(1) if m.group(1) is not None else f'[{m.group(2)}]'
+        for m in _TOKEN_RE.finditer(s)
+    ]
+
+
+def _classify_token(key:str) -> Tuple[str, Any]:
+    """
+    Tag a raw path segment with its kind so the traversal loop can dispatch
+    on the token instead of re-probing the string and cursor each step.
+    Kinds: ('key', name), ('idx', int) and ('match', (key, value)).
+    """
+    if key[:1] == '[' and key[-1:] == ']':
+        inner = key[1:-1]
+        if inner.isdigit():
+            return ('idx', int(inner))
+        if '=' in inner:
+            if inner.count('=') != 1:
+                raise ValueError(f"Invalid key=value format: '{key}'")
+            return ('match', tuple(inner.split('=', 1)))
+        raise ValueError(f"Invalid bracket selector: '{key}'")
+    return ('key', key)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_accessor(path:Tuple[Tuple[str, Any], ...]):
+    """
+    Generate a specialized accessor function that hard-codes the subscript
+    chain for a parsed path, skipping the generic traversal loop entirely.
+    Returns None for paths with [key=value] selectors, which stay on the
+    interpreted loop.
+    """
+    lines = ['def _accessor(cursor):']
+    for kind, value in path:
+        if kind == 'key':
+            lines.append(f'    cursor = cursor[{value!r}]')
+        elif kind == 'idx':
+            lines.append(f'    cursor = cursor[{value}]')
+        else:
+            return None
+    lines.append('    return cursor')
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return namespace['_accessor']
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_path(s:str) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Parse a key-path string into a tuple of typed tokens, memoized so repeated
+    lookups of the same path (the common case in services) cost a dict hit.
+    """
+    # Most paths are plain dotted keys; a C-level str.split beats the
+    # regex tokenizer by an order of magnitude on short strings
+    if '[' not in s and ']' not in s:
+        return tuple(('key', part) for part in s.split('.'))
+    return tuple(_classify_token(part) for part in split_by_dot_and_brackets(s))
 
 def iterate_and_fetch_dict_value(cursor:dict, to:Union[str, List[str]]) -> Any:
     """
@@ -67,60 +120,60 @@ def iterate_and_fetch_dict_value(cursor:dict, to:Union[str, List[str]]) -> Any:
     if isinstance(to, str):
         if not to.strip():
             raise ValueError("The provided `to` string is empty or invalid.")
-        # to = to.split('.')
-        to = split_by_dot_and_brackets(to)
+        to = _parse_path(to)
+
+        # Fast path: run the compiled accessor for this path; on any lookup
+        # failure fall through to the interpreted loop for the precise error
+        accessor = _compile_accessor(to)
+        if accessor is not None:
+            try:
+                return accessor(cursor)
+            except (KeyError, IndexError, TypeError):
+                pass
     elif isinstance(to, list):
         if not to:
             raise ValueError("The provided `to` list is empty.")
+        to = tuple(_classify_token(key) for key in to)
     else:
         raise ValueError("The provided `to` must be a string or list.")
 
+    # EAFP: subscript directly and only inspect the cursor when a step fails,
+    # instead of isinstance-probing both cursor and key on every iteration
+    kind = value = None
+    try:
+        for kind, value in to:
 
-    for key in to:
-
-        if isinstance(cursor, dict):
-
-            if check_key_under_brackets(key):
-                raise ValueError(f"Unexpected list-style key '{key}' in dict context.")
-
-            if key not in cursor:
-                raise ValueError(f"Key '{key}' not found in the cursor dictionary.")
-
-            cursor = cursor[key]
-
-        elif isinstance(cursor, list):
-
-            if not check_key_under_brackets(key):
-                raise ValueError(f"Expected list-style key like '[0]' but got '{key}'.")
+            if kind == 'key':
+                cursor = cursor[value]
 
-            inner = key[1:-1]
+            elif kind == 'idx':
+                cursor = cursor[value]
 
-            # Case: [index]
-            if inner.isdigit():
-                idx = int(inner)
-
-                if idx >= len(cursor) or idx < 0:
-                    raise IndexError(f"List index {idx} out of range.")
-
-                cursor = cursor[idx]
-
-            # Case: [key=value]
-            elif '=' in inner:
-                if inner.count('=') != 1:
-                    raise ValueError(f"Invalid key=value format: '{key}'")
-
-                inner_key, inner_value = inner.split('=', 1)
-                matched = False
+            else:  # 'match' selector, only meaningful against a list
+                inner_key, inner_value = value
+                if not isinstance(cursor, list):
+                    raise TypeError
                 for _dict in cursor:
-                    if isinstance(_dict, dict) and _dict.get(inner_key) == inner_value:
+                    if isinstance(_dict, dict) and _dict.get(inner_key, _MISSING) == inner_value:
                         cursor = _dict
-                        matched = True
                         break
-
-                if not matched:
+                else:
                     raise ValueError(f"No item in list matches condition [{inner_key}={inner_value}]")
 
-        else:
-            raise ValueError(f"Cannot traverse into type '{type(cursor).__name__}' with key '{key}'.")
+    except (KeyError, IndexError, TypeError):
+        if kind == 'key':
+            if isinstance(cursor, dict):
+                raise ValueError(f"Key '{value}' not found in the cursor dictionary.") from None
+            if isinstance(cursor, list):
+                raise ValueError(f"Expected list-style key like '[0]' but got '{value}'.") from None
+            raise ValueError(f"Cannot traverse into type '{type(cursor).__name__}' with key '{value}'.") from None
+        if kind == 'idx':
+            if isinstance(cursor, list):
+                raise IndexError(f"List index {value} out of range.") from None
+            if isinstance(cursor, dict):
+                raise ValueError(f"Unexpected list-style key '[{value}]' in dict context.") from None
+            raise ValueError(f"Cannot traverse into type '{type(cursor).__name__}' with key '[{value}]'.") from None
+        inner_key, inner_value = value
+        raise ValueError(f"Unexpected list-style key '[{inner_key}={inner_value}]' in {type(cursor).__name__} context.") from None
 
     return cursor
\ No newline at end of file
@@ -14,6 +14,9 @@ setup(
     # packages=find_packages(PACKAGE_DIR),
     packages=find_packages(),
     install_requires=install_requires,
+    extras_require={
+        'fast': ['orjson'],
+    },
     author="kenyo3026",
     author_email="kenyo3026@gmail.com",
     description="",